@@ -1,14 +1,23 @@
 """Money Transfer Client Package."""
 
 from config import TransferConfig
-from transfer import transfer_money
+from transfer import (
+    transfer_money,
+    transfer_money_async,
+    transfer_money_many,
+    transfer_money_parallel,
+)
 from client import create_session_with_retries
-from validators import validate_transfer_inputs, parse_amount
+from validators import validate_transfer_inputs, is_valid_transfer, parse_amount
 
 __all__ = [
     'TransferConfig',
     'transfer_money',
+    'transfer_money_async',
+    'transfer_money_many',
+    'transfer_money_parallel',
     'create_session_with_retries',
     'validate_transfer_inputs',
+    'is_valid_transfer',
     'parse_amount',
 ]
@@ -1,27 +1,274 @@
 """Authentication utilities for money transfer client."""
 
-import requests
+import asyncio
+import base64
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Protocol, Tuple
 
-def get_jwt_token(api_url: str, username: str, password: str, claim: str = "enquiry") -> str:
+from serialization import json_dumps, json_loads
+
+# Tokens are refreshed this many seconds before their ``exp`` claim
+TOKEN_EXPIRY_MARGIN = 60
+
+
+class AuthToken(NamedTuple):
     """
-    Authenticate with the API and retrieve a JWT token.
+    JWT token together with its refresh time and the request header that carries it.
+
+    Attributes:
+        token (str): Encoded JWT.
+        refresh_at (Optional[float]): Unix timestamp to refresh at, or None if unknown.
+        headers (Mapping[str, str]): Read-only Authorization header, built once per
+            token rather than once per request.
+    """
+    token: str
+    refresh_at: Optional[float]
+    headers: Mapping[str, str]
+
+
+class TokenProvider(Protocol):
+    """
+    Callable returning the current (cached) auth token.
+
+    ``force_refresh`` bypasses the cache. Passing the token the API rejected as
+    ``rejected_token`` lets concurrent callers that hit the same 401 share a
+    single refresh.
+    """
+
+    def __call__(self, force_refresh: bool = False, rejected_token: Optional[str] = None) -> AuthToken:
+        ...
+
+
+# Tokens keyed by (api_url, username, claim)
+_TOKEN_CACHE: Dict[Tuple[str, str, str], AuthToken] = {}
+# One lock per cache key, so concurrent callers fetch a token only once
+_TOKEN_LOCKS: Dict[Tuple[str, str, str], threading.Lock] = {}
+_TOKEN_LOCKS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def bearer_headers(token: str) -> Mapping[str, str]:
+    """
+    Return the read-only Authorization header for a token, built once per token.
+
+    Args:
+        token (str): Encoded JWT.
+
+    Returns:
+        Mapping[str, str]: ``{"Authorization": "Bearer <token>"}``.
+    """
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
+def _decode_expiry(token: str) -> Optional[float]:
+    """
+    Read the ``exp`` claim from a JWT without verifying its signature.
+
+    Args:
+        token (str): Encoded JWT.
+
+    Returns:
+        Optional[float]: Expiry as a Unix timestamp, or None if it cannot be read.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json_loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def token_refresh_at(token: str) -> Optional[float]:
+    """
+    Return when a token should be refreshed, i.e. shortly before it expires.
+
+    Args:
+        token (str): Encoded JWT.
+
+    Returns:
+        Optional[float]: Unix timestamp to refresh at, or None if the token has no expiry.
+    """
+    exp = _decode_expiry(token)
+    return exp - TOKEN_EXPIRY_MARGIN if exp is not None else None
+
+
+def _token_lock(key: Tuple[str, str, str]) -> threading.Lock:
+    """Return the fetch lock for a token cache key, creating it on first use."""
+    lock = _TOKEN_LOCKS.get(key)
+    if lock is None:
+        with _TOKEN_LOCKS_LOCK:
+            lock = _TOKEN_LOCKS.setdefault(key, threading.Lock())
+    return lock
+
+
+def _cached_token(
+    key: Tuple[str, str, str],
+    force_refresh: bool,
+    rejected_token: Optional[str]
+) -> Optional[AuthToken]:
+    """Return the cached token for ``key`` if it can be used instead of fetching a new one."""
+    cached = _TOKEN_CACHE.get(key)
+    if cached is None or time.time() >= cached.refresh_at:
+        return None
+    if force_refresh and (rejected_token is None or cached.token == rejected_token):
+        return None
+    return cached
+
+
+def get_auth_token(
+    api_url: str,
+    username: str,
+    password: str,
+    claim: str = "enquiry",
+    force_refresh: bool = False,
+    rejected_token: Optional[str] = None
+) -> AuthToken:
+    """
+    Authenticate with the API and retrieve a JWT token with its request headers.
+
+    Tokens are cached per (api_url, username, claim) and reused until shortly
+    before they expire, so repeated calls do not hit the auth endpoint. Fetches
+    are single-flight per key: callers that find the token missing or stale at
+    the same time wait for one request and share its result.
 
     Args:
         api_url (str): Base URL of the API.
         username (str): Username for authentication.
         password (str): Password for authentication.
         claim (str): Claim/scope for the token (default: "enquiry").
+        force_refresh (bool): Ignore any cached token, e.g. after a 401 response.
+        rejected_token (Optional[str]): With ``force_refresh``, the token the API
+            rejected. If another caller has already replaced it in the cache, the
+            replacement is returned without fetching again.
 
     Returns:
-        str: JWT token if authentication is successful.
+        AuthToken: Token, refresh time and prepared headers.
 
     Raises:
         Exception: If authentication fails or the request is invalid.
     """
+    key = (api_url, username, claim)
+    cached = _cached_token(key, force_refresh, rejected_token)
+    if cached is not None:
+        return cached
+
+    with _token_lock(key):
+        # Another caller may have fetched a token while we waited for the lock
+        cached = _cached_token(key, force_refresh, rejected_token)
+        if cached is not None:
+            return cached
+        return _fetch_auth_token(key, api_url, username, password, claim)
+
+
+def _fetch_auth_token(
+    key: Tuple[str, str, str],
+    api_url: str,
+    username: str,
+    password: str,
+    claim: str
+) -> AuthToken:
+    """Request a new token from the auth endpoint and update the cache; see :func:`get_auth_token`."""
+    # Imported here so that importing this module (e.g. for TokenProvider) stays cheap
+    import requests
+
     auth_url = f"{api_url}/authToken?claim={claim}"
-    response = requests.post(auth_url, json={"username": username, "password": password})
+    response = requests.post(
+        auth_url,
+        data=json_dumps({"username": username, "password": password}),
+        headers={"Content-Type": "application/json"}
+    )
 
     if response.status_code == 200:
-        return response.json().get("token")
+        token = json_loads(response.content).get("token")
+        auth_token = AuthToken(
+            token,
+            token_refresh_at(token) if token else None,
+            bearer_headers(token)
+        )
+        if auth_token.refresh_at is not None:
+            _TOKEN_CACHE[key] = auth_token
+        else:
+            _TOKEN_CACHE.pop(key, None)
+        return auth_token
     else:
-        raise Exception(f"Authentication failed: {response.json().get('error', 'Unknown error')}")
+        raise Exception(f"Authentication failed: {json_loads(response.content).get('error', 'Unknown error')}")
+
+
+def get_jwt_token(
+    api_url: str,
+    username: str,
+    password: str,
+    claim: str = "enquiry",
+    force_refresh: bool = False
+) -> str:
+    """
+    Authenticate with the API and retrieve a JWT token.
+
+    Shares the token cache with :func:`get_auth_token`.
+
+    Args:
+        api_url (str): Base URL of the API.
+        username (str): Username for authentication.
+        password (str): Password for authentication.
+        claim (str): Claim/scope for the token (default: "enquiry").
+        force_refresh (bool): Ignore any cached token, e.g. after a 401 response.
+
+    Returns:
+        str: JWT token if authentication is successful.
+
+    Raises:
+        Exception: If authentication fails or the request is invalid.
+    """
+    return get_auth_token(api_url, username, password, claim, force_refresh).token
+
+
+def make_token_provider(api_url: str, username: str, password: str, claim: str = "enquiry") -> TokenProvider:
+    """
+    Bind credentials into a callable that returns the (cached) auth token.
+
+    Args:
+        api_url (str): Base URL of the API.
+        username (str): Username for authentication.
+        password (str): Password for authentication.
+        claim (str): Claim/scope for the token (default: "enquiry").
+
+    Returns:
+        TokenProvider: Callable taking ``force_refresh`` (and optionally the rejected
+        token) and returning an AuthToken.
+    """
+    def provider(force_refresh: bool = False, rejected_token: Optional[str] = None) -> AuthToken:
+        return get_auth_token(
+            api_url, username, password, claim, force_refresh=force_refresh, rejected_token=rejected_token
+        )
+
+    return provider
+
+
+async def get_jwt_token_async(
+    api_url: str,
+    username: str,
+    password: str,
+    claim: str = "enquiry",
+    force_refresh: bool = False
+) -> str:
+    """
+    Retrieve a JWT token without blocking the event loop.
+
+    Args:
+        api_url (str): Base URL of the API.
+        username (str): Username for authentication.
+        password (str): Password for authentication.
+        claim (str): Claim/scope for the token (default: "enquiry").
+        force_refresh (bool): Ignore any cached token, e.g. after a 401 response.
+
+    Returns:
+        str: JWT token if authentication is successful.
+
+    Raises:
+        Exception: If authentication fails or the request is invalid.
+    """
+    return await asyncio.to_thread(get_jwt_token, api_url, username, password, claim, force_refresh)
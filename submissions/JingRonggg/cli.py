@@ -1,69 +1,231 @@
 """Command-line interface for money transfer system."""
 
+import asyncio
+import csv
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+from auth import TOKEN_EXPIRY_MARGIN, TokenProvider
+from client import get_session
 from config import TransferConfig
-from transfer import transfer_money
-from validators import parse_amount
+from transfer import transfer_money_async, transfer_money_many
+from validators import is_valid_transfer, parse_amount, validate_transfer_inputs
 
 logger = logging.getLogger(__name__)
 
 
-def run_interactive_cli(config: TransferConfig, jwt_token: Optional[str] = None) -> None:
+async def _ainput(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    A daemon thread is used instead of ``asyncio.to_thread`` so that a prompt
+    abandoned on Ctrl+C cannot keep the interpreter alive at shutdown.
+
+    Args:
+        prompt (str): Prompt to display.
+
+    Returns:
+        str: Line entered by the user.
+
+    Raises:
+        EOFError: If stdin is closed.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read() -> None:
+        try:
+            line, error = input(prompt), None
+        except EOFError as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, line, error)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def _periodic_jwt_refresh(token_provider: TokenProvider) -> None:
+    """
+    Keep the cached JWT fresh in the background while the CLI waits for input.
+
+    Sleeps until the token is due for refresh, then fetches a new one, so
+    transfers never have to wait for authentication themselves.
+
+    Args:
+        token_provider (TokenProvider): Source of JWT tokens.
+    """
+    while True:
+        try:
+            auth_token = await asyncio.to_thread(token_provider, False)
+        except Exception as e:
+            logger.warning("Background JWT refresh failed: %s", e)
+            await asyncio.sleep(TOKEN_EXPIRY_MARGIN / 2)
+            continue
+
+        if auth_token.refresh_at is None:
+            return  # No expiry to track; refresh-on-401 still applies
+        # Sleep just past the refresh time so the provider fetches a new token
+        await asyncio.sleep(max(auth_token.refresh_at - time.time(), 0) + 1)
+
+
+async def run_interactive_cli(
+    config: TransferConfig,
+    jwt_token: Optional[str] = None,
+    token_provider: Optional[TokenProvider] = None
+) -> None:
     """
     Run interactive command-line interface for transfers.
+
+    Prompts are read without blocking the event loop, so transfers and the
+    background JWT refresh keep running while the user types.
     
     Args:
         config (TransferConfig): Transfer configuration object.
         jwt_token (Optional[str]): Optional JWT token for authenticated requests.
+        token_provider (Optional[TokenProvider]): Source of JWT tokens, refreshed
+            before expiry and on 401.
     """
     logger.info("Starting money transfer client...")
-    logger.info(f"API URL: {config.api_url}")
+    logger.info("API URL: %s", config.api_url)
     
-    # Continuous loop for processing transfers
-    while True:
-        try:
-            print("\n" + "="*50)
-            print("Money Transfer System")
-            print("="*50)
-            
-            # Get account and amount details from user
-            from_acc = input("Enter source account (or 'quit' to exit): ").strip()
-            
-            # Allow user to exit the loop
-            if from_acc.lower() in ['quit', 'exit', 'q']:
-                logger.info("Exiting money transfer client...")
-                break
-            
-            to_acc = input("Enter destination account: ").strip()
-            amount_str = input("Enter amount to transfer: ").strip()
-            
-            # Validate and convert amount
+    # One session for the whole CLI run so connections are reused across transfers
+    session = get_session(config)
+
+    refresher = None
+    if token_provider is not None:
+        refresher = asyncio.create_task(_periodic_jwt_refresh(token_provider))
+    
+    try:
+        # Continuous loop for processing transfers
+        while True:
             try:
-                amount = parse_amount(amount_str)
-            except ValueError as e:
-                logger.error(str(e))
-                continue
-            
-            # Attempt the transfer
-            result = transfer_money(from_acc, to_acc, amount, config, jwt_token=jwt_token)
-            
-            if result:
-                logger.info(f"Transfer completed: {result}")
-                print(f"\n✓ Transfer completed! Transaction ID: {result.get('transactionId', 'N/A')}")
-            else:
-                logger.error("Transfer failed - check logs above for details")
-                print("\n✗ Transfer failed. Please try again.")
+                print("\n" + "="*50)
+                print("Money Transfer System")
+                print("="*50)
                 
-        except KeyboardInterrupt:
-            logger.info("\nReceived keyboard interrupt. Exiting...")
-            break
-        except ValueError as e:
-            logger.error(f"Validation error: {str(e)}")
-            print(f"\n✗ Error: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error in main loop: {type(e).__name__} - {str(e)}")
-            print(f"\n✗ Unexpected error: {str(e)}")
+                # Get account and amount details from user
+                from_acc = (await _ainput("Enter source account (or 'quit' to exit): ")).strip()
+                
+                # Allow user to exit the loop
+                if from_acc.lower() in ['quit', 'exit', 'q']:
+                    logger.info("Exiting money transfer client...")
+                    break
+                
+                to_acc = (await _ainput("Enter destination account: ")).strip()
+                amount_str = (await _ainput("Enter amount to transfer: ")).strip()
+                
+                # Validate and convert amount to cents
+                try:
+                    amount = parse_amount(amount_str)
+                except ValueError as e:
+                    logger.error("%s", e)
+                    continue
+                
+                # Attempt the transfer
+                result = await transfer_money_async(
+                    from_acc, to_acc, amount, config, jwt_token=jwt_token, session=session,
+                    token_provider=token_provider
+                )
+                
+                if result:
+                    logger.info("Transfer completed: %s", result)
+                    print(f"\n✓ Transfer completed! Transaction ID: {result.get('transactionId', 'N/A')}")
+                else:
+                    logger.error("Transfer failed - check logs above for details")
+                    print("\n✗ Transfer failed. Please try again.")
+                    
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                logger.info("\nReceived keyboard interrupt. Exiting...")
+                break
+            except EOFError:
+                logger.info("\nInput closed. Exiting...")
+                break
+            except ValueError as e:
+                logger.error("Validation error: %s", e)
+                print(f"\n✗ Error: {e}")
+            except Exception as e:
+                logger.exception("Unexpected error in main loop")
+                print(f"\n✗ Unexpected error: {e}")
+    finally:
+        if refresher is not None:
+            refresher.cancel()
     
     print("\nThank you for using the Money Transfer System!")
+
+
+def _read_batch_file(path: str) -> List[Tuple[str, str, int]]:
+    """
+    Read transfers from a CSV file with ``from_acc,to_acc,amount`` rows.
+
+    Blank lines and lines starting with ``#`` are ignored. Malformed or invalid
+    rows are logged and skipped here, so they never reach the concurrent phase.
+
+    Args:
+        path (str): Path to the CSV file.
+
+    Returns:
+        List[Tuple[str, str, int]]: Parsed (from_acc, to_acc, amount in cents) rows.
+    """
+    rows = []
+    with open(path, newline="") as f:
+        for line_no, fields in enumerate(csv.reader(f), start=1):
+            if not fields or not fields[0].strip() or fields[0].lstrip().startswith("#"):
+                continue
+            if len(fields) != 3:
+                logger.error("Line %d: expected 3 fields, got %d", line_no, len(fields))
+                continue
+            from_acc, to_acc, amount_str = (field.strip() for field in fields)
+            try:
+                row = (from_acc, to_acc, parse_amount(amount_str))
+                if not is_valid_transfer(*row):
+                    # Cold path: re-run the full checks for a specific error message
+                    validate_transfer_inputs(*row)
+            except ValueError as e:
+                logger.error("Line %d: %s", line_no, e)
+                continue
+            rows.append(row)
+    return rows
+
+
+async def run_batch(
+    config: TransferConfig,
+    path: str,
+    jwt_token: Optional[str] = None,
+    token_provider: Optional[TokenProvider] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Run the transfers listed in a CSV file concurrently.
+
+    At most ``config.max_concurrency`` transfers are in flight at once, all
+    sharing one pooled session.
+
+    Args:
+        config (TransferConfig): Transfer configuration object.
+        path (str): Path to a CSV file with ``from_acc,to_acc,amount`` rows.
+        jwt_token (Optional[str]): Optional JWT token for authenticated requests.
+        token_provider (Optional[TokenProvider]): Source of JWT tokens, refreshed on 401.
+
+    Returns:
+        List[Optional[Dict[str, Any]]]: API response per valid row, or None where the transfer failed.
+    """
+    rows = _read_batch_file(path)
+    logger.info("Running %d transfers from %s (concurrency: %d)", len(rows), path, config.max_concurrency)
+
+    results = await transfer_money_many(rows, config, jwt_token=jwt_token, token_provider=token_provider)
+
+    succeeded = sum(result is not None for result in results)
+    print(f"\nBatch complete: {succeeded}/{len(results)} transfers succeeded.")
+    return results
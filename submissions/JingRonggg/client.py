@@ -1,16 +1,173 @@
 """HTTP client management with retry logic."""
 
+import atexit
+import random
+import socket
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Tuple
+
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
-from typing import Optional
 
 from config import TransferConfig
 
+# Shared sessions reused across transfers so connections are kept alive between
+# calls, keyed by the settings that shape a session. Async transfers send through
+# them from worker threads; that is safe as long as a session is not mutated after
+# creation. The lock only guards creation and teardown.
+_SESSION_CACHE: Dict[Tuple[str, int, float, int], requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+# Resolved addresses keyed by (host, port), as (resolved_at, ips) pairs
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[float, Tuple[str, ...]]] = {}
+# Seconds a resolved address is reused before the host is looked up again
+DNS_CACHE_TTL = 60.0
+
+
+def _resolve(host: str, port: int) -> Tuple[str, ...]:
+    """
+    Resolve ``host`` to its IP addresses, reusing the answer for up to ``DNS_CACHE_TTL`` seconds.
+
+    Args:
+        host (str): Hostname (or IP literal) to resolve.
+        port (int): Port the connection is for.
+
+    Returns:
+        Tuple[str, ...]: Distinct IP addresses in resolver order (e.g. ``::1`` then
+        ``127.0.0.1`` for a dual-stack ``localhost``).
+
+    Raises:
+        OSError: If the host cannot be resolved.
+    """
+    key = (host, port)
+    entry = _DNS_CACHE.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < DNS_CACHE_TTL:
+        return entry[1]
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    ips = tuple(dict.fromkeys(info[4][0] for info in infos))
+    _DNS_CACHE[key] = (now, ips)
+    return ips
+
+
+class _CachedDNSMixin:
+    """
+    Connect to the cached addresses of the host instead of resolving it on every reconnect.
+
+    Like urllib3's own resolution, every address is tried in order until one
+    connects; the one that worked is moved to the front of the cached list so
+    later connections try it first. urllib3 derives ``host`` (and so the Host
+    header and TLS SNI/certificate hostname) from ``_dns_host``, so each IP is
+    swapped in only while the socket is opened. If no address connects, the
+    cache entry is dropped and the next attempt resolves the host again.
+    """
+
+    def _new_conn(self) -> socket.socket:
+        hostname = self._dns_host
+        try:
+            ips = _resolve(hostname, self.port)
+        except OSError:
+            return super()._new_conn()  # Let urllib3 resolve it and report the failure
+
+        error = None
+        try:
+            for i, ip in enumerate(ips):
+                self._dns_host = ip
+                try:
+                    conn = super()._new_conn()
+                except Exception as e:
+                    error = e
+                    continue
+                if i:
+                    entry = _DNS_CACHE.get((hostname, self.port))
+                    if entry is not None and entry[1] == ips:
+                        _DNS_CACHE[(hostname, self.port)] = (entry[0], (ip,) + ips[:i] + ips[i + 1:])
+                return conn
+        finally:
+            self._dns_host = hostname
+
+        _DNS_CACHE.pop((hostname, self.port), None)
+        raise error
+
+
+class _CachedDNSHTTPConnection(_CachedDNSMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections reuse DNS answers for ``DNS_CACHE_TTL`` seconds."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CachedDNSHTTPConnectionPool,
+            "https": _CachedDNSHTTPSConnectionPool,
+        }
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry using exponential backoff with full jitter.
+
+    The n-th retry sleeps ``random() * min(backoff_factor * 2 ** (n - 1), BACKOFF_CAP)``
+    seconds. Clients that fail together (e.g. during a 503 spike) would otherwise
+    retry in lockstep; full jitter spreads them across the whole window.
+    Retry-After headers still take precedence over the computed backoff.
+
+    POST is not idempotent. transfer_money sends the same Idempotency-Key with
+    every attempt so that a server which deduplicates on it can recognise
+    replays, but the banking API ignores the header: a 429/5xx retried here may
+    follow a transfer the server already executed, and so duplicate it.
+    """
+
+    # Upper bound for a single backoff sleep, in seconds
+    BACKOFF_CAP = 15.0
+
+    def get_backoff_time(self) -> float:
+        attempt = len(self.history)
+        if attempt == 0:
+            return 0.0
+        return random.random() * min(self.backoff_factor * 2 ** (attempt - 1), self.BACKOFF_CAP)
+
+
+@lru_cache(maxsize=8)
+def _retry_strategy(max_retries: int, backoff_factor: float) -> Retry:
+    """
+    Build the retry policy for the given settings, shared by every session that uses them.
+
+    Retry objects are never mutated (urllib3 derives a new one on each attempt),
+    so a single instance can be mounted on any number of adapters.
+    """
+    return JitteredRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,  # Full jitter: delays drawn from [0, 1s], [0, 2s], [0, 4s]...
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False  # Don't raise on retry exhaustion
+    )
+
 
 def create_session_with_retries(config: TransferConfig) -> requests.Session:
     """
-    Create a requests session with binary exponential backoff retry strategy.
+    Create a requests session with a full-jitter exponential backoff retry strategy.
 
     Args:
         config (TransferConfig): Transfer configuration object.
@@ -19,17 +176,51 @@ def create_session_with_retries(config: TransferConfig) -> requests.Session:
         requests.Session: Configured requests.Session with retry logic.
     """
     session = requests.Session()
+    # Static headers live on the session so requests only carry Authorization
+    session.headers.update(config.default_headers)
     
-    retry_strategy = Retry(
-        total=config.max_retries,
-        backoff_factor=config.backoff_factor,  # Binary exponential: delays = 1s, 2s, 4s, 8s...
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["POST"],
-        raise_on_status=False  # Don't raise on retry exhaustion
-    )
+    retry_strategy = _retry_strategy(config.max_retries, config.backoff_factor)
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Keep one idle keep-alive connection per concurrent transfer; a smaller pool
+    # would close and reopen sockets whenever a batch runs at full concurrency.
+    # Reopened sockets reuse the cached DNS answer rather than resolving again.
+    adapter = CachedDNSAdapter(max_retries=retry_strategy, pool_maxsize=config.max_concurrency)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
     return session
+
+
+def get_session(config: TransferConfig) -> requests.Session:
+    """
+    Return the shared session for the given configuration, creating it on first use.
+
+    Configurations with the same API URL, retry settings and pool size share a session.
+
+    Args:
+        config (TransferConfig): Transfer configuration object.
+
+    Returns:
+        requests.Session: Shared requests.Session with retry logic.
+    """
+    key = (config.api_url, config.max_retries, config.backoff_factor, config.max_concurrency)
+    session = _SESSION_CACHE.get(key)
+    if session is None:
+        with _SESSION_LOCK:
+            # Another thread may have created it while we waited for the lock
+            session = _SESSION_CACHE.get(key)
+            if session is None:
+                session = _SESSION_CACHE[key] = create_session_with_retries(config)
+    return session
+
+
+def close_all_sessions() -> None:
+    """Close every shared session; later calls to :func:`get_session` create new ones."""
+    with _SESSION_LOCK:
+        sessions = list(_SESSION_CACHE.values())
+        _SESSION_CACHE.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_all_sessions)
@@ -1,10 +1,22 @@
 """Configuration management for money transfer client."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
+# Headers sent with every request on the shared session. Responses are small
+# JSON documents, so compressing them costs more CPU than it saves bandwidth.
+DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Content-Type": "application/json",
+    "User-Agent": "MoneyTransferClient/1.0",
+    "Accept-Encoding": "identity",
+    "Connection": "keep-alive"
+})
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TransferConfig:
     """
     Configuration for money transfer API client.
@@ -14,23 +26,57 @@ class TransferConfig:
         timeout (int): Request timeout in seconds.
         max_retries (int): Maximum number of retry attempts.
         backoff_factor (float): Binary exponential backoff factor.
+        max_concurrency (int): Maximum number of transfers in flight in batch mode.
+        idempotency_cache_ttl (float): Seconds a successful result is replayed for a
+            re-submitted transfer with the same idempotency key (0 disables).
+        breaker_threshold (int): Consecutive failed transfers that open the circuit
+            breaker (0 disables).
+        breaker_cooldown_s (float): Seconds the open breaker rejects transfers before
+            letting a single probe through.
+        transfer_url (str): Transfer endpoint URL, derived from api_url.
+        default_headers (Mapping[str, str]): Read-only headers set on the shared session.
     """
     api_url: str
     timeout: int = 30
     max_retries: int = 3
-    backoff_factor: float = 1.0  # Binary exponential backoff (1s, 2s, 4s, 8s...)
+    backoff_factor: float = 1.0  # Binary exponential backoff bound (1s, 2s, 4s, 8s...), fully jittered
+    max_concurrency: int = 16
+    idempotency_cache_ttl: float = 2.0
+    breaker_threshold: int = 5
+    breaker_cooldown_s: float = 30.0
+    transfer_url: str = field(init=False, repr=False, compare=False)
+    default_headers: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute per-request constants once instead of on every transfer."""
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(self, 'transfer_url', f"{self.api_url}/transfer")
+        object.__setattr__(self, 'default_headers', DEFAULT_HEADERS)
     
     @classmethod
     def from_environment(cls) -> 'TransferConfig':
         """
         Create configuration from environment variables with defaults.
 
+        The environment is read once per process; later calls return the same
+        (immutable) instance.
+
         Returns:
             TransferConfig: Configuration object populated from environment variables.
         """
-        return cls(
-            api_url=os.getenv('TRANSFER_API_URL', 'http://localhost:8123'),
-            timeout=int(os.getenv('TRANSFER_TIMEOUT', '30')),
-            max_retries=int(os.getenv('TRANSFER_MAX_RETRIES', '3')),
-            backoff_factor=float(os.getenv('TRANSFER_BACKOFF_FACTOR', '1.0'))
-        )
+        return _load_config_from_env()
+
+
+@lru_cache(maxsize=1)
+def _load_config_from_env() -> TransferConfig:
+    """Build the environment-derived configuration; cached by ``from_environment``."""
+    return TransferConfig(
+        api_url=os.getenv('TRANSFER_API_URL', 'http://localhost:8123'),
+        timeout=int(os.getenv('TRANSFER_TIMEOUT', '30')),
+        max_retries=int(os.getenv('TRANSFER_MAX_RETRIES', '3')),
+        backoff_factor=float(os.getenv('TRANSFER_BACKOFF_FACTOR', '1.0')),
+        max_concurrency=int(os.getenv('TRANSFER_CONCURRENCY', '16')),
+        idempotency_cache_ttl=float(os.getenv('TRANSFER_IDEMPOTENCY_CACHE_TTL', '2.0')),
+        breaker_threshold=int(os.getenv('TRANSFER_BREAKER_THRESHOLD', '5')),
+        breaker_cooldown_s=float(os.getenv('TRANSFER_BREAKER_COOLDOWN', '30'))
+    )
@@ -1,23 +1,40 @@
 """Money Transfer Client - Main Entry Point."""
 
+import argparse
+import asyncio
 import logging
-import colorlog
+import sys
 from config import TransferConfig
-from cli import run_interactive_cli
-from auth import get_jwt_token
-
-handler = colorlog.StreamHandler()
-handler.setFormatter(colorlog.ColoredFormatter(
-    "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt='%Y-%m-%d %H:%M:%S',
-    log_colors={
-        'DEBUG': 'cyan',
-        'INFO': 'green',
-        'WARNING': 'yellow',
-        'ERROR': 'red',
-        'CRITICAL': 'bold_red',
-    }
-))
+from cli import run_batch, run_interactive_cli
+from auth import make_token_provider
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# The format never uses thread/process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+if sys.stderr.isatty():
+    import colorlog
+
+    handler = colorlog.StreamHandler()
+    handler.setFormatter(colorlog.ColoredFormatter(
+        "%(log_color)s" + LOG_FORMAT,
+        datefmt=LOG_DATE_FORMAT,
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'bold_red',
+        }
+    ))
+else:
+    # Redirected output (e.g. batch runs) gets no colour codes and no per-record colour pass
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
 logging.basicConfig(level=logging.INFO, handlers=[handler])
 
 
@@ -26,11 +43,19 @@ def main() -> None:
     Main execution function for the money transfer client.
 
     Prompts the user for authentication details, retrieves a JWT token,
-    and starts the interactive CLI.
+    and starts the interactive CLI, or runs a CSV batch when ``--batch`` is given.
 
     Raises:
         Exception: If authentication fails or invalid inputs are provided.
     """
+    parser = argparse.ArgumentParser(description="Money Transfer Client")
+    parser.add_argument(
+        "--batch",
+        metavar="CSV",
+        help="Run the transfers in CSV (from_acc,to_acc,amount per line) concurrently"
+    )
+    args = parser.parse_args()
+
     config = TransferConfig.from_environment()
 
     # Prompt for username, password, and claim type
@@ -42,15 +67,25 @@ def main() -> None:
         logging.error("Invalid claim type. Please enter 'enquiry' or 'transfer'.")
         return
 
+    token_provider = make_token_provider(config.api_url, username, password, claim=claim)
     try:
-        jwt_token = get_jwt_token(config.api_url, username, password, claim=claim)
+        # Authenticate up front so bad credentials fail before the CLI starts
+        token_provider(False)
         logging.info("Authentication successful. JWT token retrieved.")
     except Exception as e:
-        logging.error(f"Authentication failed: {e}")
+        logging.error("Authentication failed: %s", e)
         return
 
-    # Pass the JWT token to the CLI or other components as needed
-    run_interactive_cli(config, jwt_token=jwt_token)
+    # Pass the token provider so expired tokens are refreshed transparently
+    if args.batch:
+        app = run_batch(config, args.batch, token_provider=token_provider)
+    else:
+        app = run_interactive_cli(config, token_provider=token_provider)
+
+    try:
+        asyncio.run(app)
+    except KeyboardInterrupt:
+        logging.info("Received keyboard interrupt. Exiting...")
 
 
 if __name__ == "__main__":
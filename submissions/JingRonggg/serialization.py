@@ -0,0 +1,27 @@
+"""JSON encoding and decoding for API requests and responses."""
+
+from typing import Any
+
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # orjson is optional; fall back to the standard library
+    import json
+    from dataclasses import asdict, is_dataclass
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def _json_default(obj: Any) -> Any:
+        """Encode dataclass instances as objects, as orjson does natively."""
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return asdict(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` (dataclasses included) to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+    json_loads = json.loads
@@ -1,33 +1,184 @@
 """Money transfer API operations."""
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, Any
-
-import requests
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, List, Tuple
 
+from auth import TokenProvider, bearer_headers
 from config import TransferConfig
-from client import create_session_with_retries
+from serialization import JSONDecodeError, json_dumps, json_loads
 from validators import validate_transfer_inputs
 
+# requests (and the client module built on it) accounts for most of this
+# module's import time, so it is imported on first use instead
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
+# Recent successful response bodies keyed by a digest of the transfer and its
+# idempotency key. Raw bytes are stored so every replay decodes its own copy.
+_RESULT_CACHE: Dict[str, Tuple[float, bytes]] = {}
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_MAX_ENTRIES = 1024
+
+# Circuit breaker state per API URL (like the shared sessions): consecutive
+# failures and the monotonic time until which transfers are rejected unsent
+_BREAKERS: Dict[str, Dict[str, float]] = {}
+_BREAKER_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class _TransferPayload:
+    """
+    Request body of the transfer endpoint; field names match the API's JSON keys.
+
+    Immutable, so one instance can be shared by retries and the 401 re-send.
+
+    Attributes:
+        fromAccount (str): Source account identifier.
+        toAccount (str): Destination account identifier.
+        amount (float): Amount in major units, as the API expects.
+    """
+    fromAccount: str
+    toAccount: str
+    amount: float
+
+
+def _result_cache_key(body: bytes, idempotency_key: str) -> str:
+    """Digest identifying one logical transfer (encoded payload plus key) for the result cache."""
+    hasher = hashlib.blake2b(body, digest_size=16)
+    hasher.update(idempotency_key.encode())
+    return hasher.hexdigest()
+
+
+def _get_cached_result(key: str, ttl: float) -> Optional[Dict[str, Any]]:
+    """Return a fresh copy of the cached result for ``key`` if it is younger than ``ttl`` seconds."""
+    entry = _RESULT_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return json_loads(entry[1])
+    return None
+
+
+def _store_result(key: str, content: bytes, ttl: float) -> None:
+    """Cache a successful response body, evicting expired (then oldest) entries when full."""
+    now = time.monotonic()
+    with _RESULT_CACHE_LOCK:
+        if len(_RESULT_CACHE) >= _RESULT_CACHE_MAX_ENTRIES:
+            for stale in [k for k, (stored_at, _) in _RESULT_CACHE.items() if now - stored_at >= ttl]:
+                del _RESULT_CACHE[stale]
+            while len(_RESULT_CACHE) >= _RESULT_CACHE_MAX_ENTRIES:
+                del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+        _RESULT_CACHE[key] = (now, content)
+
+
+def _breaker_state(api_url: str) -> Dict[str, float]:
+    """Return the circuit breaker state for ``api_url``, creating it on first use."""
+    state = _BREAKERS.get(api_url)
+    if state is None:
+        with _BREAKER_LOCK:
+            state = _BREAKERS.setdefault(api_url, {"failures": 0, "open_until": 0.0})
+    return state
+
+
+def _breaker_allows(config: TransferConfig) -> bool:
+    """
+    Check whether the circuit breaker for ``config.api_url`` lets a transfer through.
+
+    While open, transfers are rejected until the cool-down ends. The first
+    caller after that is let through as a probe and pushes the deadline back by
+    another cool-down, so only one probe is in flight at a time and a probe that
+    never reports back cannot leave the breaker stuck.
+
+    Args:
+        config (TransferConfig): Transfer configuration object.
+
+    Returns:
+        bool: True if the transfer may be sent.
+    """
+    if config.breaker_threshold <= 0:
+        return True
+    state = _breaker_state(config.api_url)
+    # Unlocked fast path: a closed breaker is the common case
+    if state["failures"] < config.breaker_threshold:
+        return True
+    with _BREAKER_LOCK:
+        now = time.monotonic()
+        if state["failures"] < config.breaker_threshold:
+            return True
+        if now < state["open_until"]:
+            return False
+        state["open_until"] = now + config.breaker_cooldown_s
+        logger.info("Circuit breaker cool-down over - sending a probe transfer to %s", config.api_url)
+        return True
+
+
+def _record_outcome(config: TransferConfig, healthy: bool) -> None:
+    """
+    Update the circuit breaker for ``config.api_url`` after a transfer reached (or failed to reach) it.
+
+    Args:
+        config (TransferConfig): Transfer configuration object.
+        healthy (bool): False for connection errors, timeouts and 5xx responses.
+    """
+    if config.breaker_threshold <= 0:
+        return
+    state = _breaker_state(config.api_url)
+    if healthy:
+        if state["failures"]:
+            with _BREAKER_LOCK:
+                state["failures"] = 0
+        return
+    with _BREAKER_LOCK:
+        state["failures"] += 1
+        if state["failures"] >= config.breaker_threshold:
+            state["open_until"] = time.monotonic() + config.breaker_cooldown_s
+            logger.warning(
+                "Circuit breaker for %s open after %d consecutive failures - rejecting transfers for %gs",
+                config.api_url, state["failures"], config.breaker_cooldown_s
+            )
+
 
 def transfer_money(
     from_acc: str,
     to_acc: str,
-    amount: float,
+    amount_minor: int,
     config: Optional[TransferConfig] = None,
-    jwt_token: Optional[str] = None
+    jwt_token: Optional[str] = None,
+    session: Optional["requests.Session"] = None,
+    token_provider: Optional[TokenProvider] = None,
+    idempotency_key: Optional[str] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Transfer money from one account to another via API.
 
+    Every request carries an Idempotency-Key header that stays the same across
+    retries and the 401 re-send, for servers that deduplicate on it. The banking
+    API does not, so the automatic POST retries on 429/5xx responses can still
+    duplicate a transfer against it. Re-submitting a transfer with the same
+    caller-supplied key within ``config.idempotency_cache_ttl`` seconds of its
+    success returns the earlier result without another request.
+
     Args:
         from_acc (str): Source account identifier.
         to_acc (str): Destination account identifier.
-        amount (float): Amount to transfer in the account's currency.
+        amount_minor (int): Amount to transfer in minor units (cents) of the account's currency.
         config (Optional[TransferConfig]): Transfer configuration object.
         jwt_token (Optional[str]): Optional JWT token for authenticated requests.
+        session (Optional[requests.Session]): Session to send the request with.
+            Defaults to the shared session for ``config``.
+        token_provider (Optional[TokenProvider]): Source of JWT tokens. Takes precedence
+            over ``jwt_token`` and is asked for a fresh token once if the API returns 401.
+        idempotency_key (Optional[str]): Key identifying this logical transfer. A random
+            UUID is generated when omitted. A key reused within ``config.idempotency_cache_ttl``
+            seconds of a success returns the cached result; otherwise the transfer is sent
+            again, and the banking API does not deduplicate it.
 
     Returns:
         Optional[Dict[str, Any]]: JSON response from the API containing transfer confirmation,
@@ -38,96 +189,297 @@ def transfer_money(
 
     Example:
         >>> config = TransferConfig.from_environment()
-        >>> result = transfer_money("ACC1000", "ACC1001", 100.00, config)
+        >>> result = transfer_money("ACC1000", "ACC1001", 10000, config)  # $100.00
         >>> if result:
         ...     print(f"Transfer successful: {result['transactionId']}")
     """
     # Validate inputs
-    validate_transfer_inputs(from_acc, to_acc, amount)
+    validate_transfer_inputs(from_acc, to_acc, amount_minor)
 
     # Load configuration
     if config is None:
         config = TransferConfig.from_environment()
 
     # API endpoint for money transfers
-    url = f"{config.api_url}/transfer"
+    url = config.transfer_url
+
+    # Prepare and encode the request payload once; the body is reused by the
+    # result cache key, retries and the 401 re-send
+    payload = _TransferPayload(from_acc, to_acc, amount_minor / 100)  # The API takes major units
+    body = json_dumps(payload)
+
+    # Only caller-supplied keys can repeat, so only they are worth a cache lookup
+    cache_key = None
+    if idempotency_key and config.idempotency_cache_ttl > 0:
+        cache_key = _result_cache_key(body, idempotency_key)
+        cached = _get_cached_result(cache_key, config.idempotency_cache_ttl)
+        if cached is not None:
+            logger.info("Returning cached result for idempotency key %s", idempotency_key)
+            return cached
 
-    # Prepare request payload
-    data = {
-        "fromAccount": from_acc,
-        "toAccount": to_acc,
-        "amount": amount
-    }
+    # Fail fast while the API is known to be down rather than spending retries on it
+    if not _breaker_allows(config):
+        logger.warning("Circuit breaker open - transfer %s -> %s not sent", from_acc, to_acc)
+        return None
+
+    # One key per logical transfer, shared by every attempt to send it
+    if not idempotency_key:
+        idempotency_key = str(uuid.uuid4())
 
     logger.info(
-        f"Initiating transfer: {from_acc} -> {to_acc}, "
-        f"amount: ${amount:.2f}"
+        "Initiating transfer: %s -> %s, amount: $%.2f (idempotency key: %s)",
+        from_acc, to_acc, amount_minor / 100, idempotency_key
     )
 
-    try:
-        # Create session with retry logic
-        session = create_session_with_retries(config)
+    # Deferred imports (see top of module); cheap sys.modules lookups after the first transfer
+    import requests
+    from client import get_session
 
-        # Send POST request to transfer endpoint
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "MoneyTransferClient/1.0"
-        }
-        if jwt_token:
-            headers["Authorization"] = f"Bearer {jwt_token}"
+    # Reuse the shared session so keep-alive connections survive between transfers
+    if session is None:
+        session = get_session(config)
+
+    try:
+        # Send POST request to transfer endpoint; the session already carries the
+        # static headers and the Authorization header is built once per token
+        headers = {"Idempotency-Key": idempotency_key}
+        if token_provider is not None:
+            auth_token = token_provider(False)
+            headers.update(auth_token.headers)
+        elif jwt_token:
+            headers.update(bearer_headers(jwt_token))
 
         response = session.post(
             url,
-            json=data,
+            data=body,
+            timeout=config.timeout,
+            headers=headers
+        )
+
+        # Token expired or was revoked - refresh it and retry exactly once
+        if response.status_code == 401 and token_provider is not None:
+            logger.warning("Received 401 Unauthorized - refreshing JWT token and retrying")
+            # Pass the rejected token so concurrent 401s share a single refresh
+            headers.update(token_provider(True, auth_token.token).headers)
+            response = session.post(
+            url,
+            data=body,
             timeout=config.timeout,
             headers=headers
         )
 
-        # Raise exception for HTTP error status codes (4xx, 5xx)
-        response.raise_for_status()
+        # Raise exception for HTTP error status codes (4xx, 5xx); the handler
+        # below reports the status and body, so no reason phrase is formatted
+        status = response.status_code
+        _record_outcome(config, status < 500)
+        if status >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {status} for url: {url}", response=response)
 
         # Parse and return JSON response
-        result = response.json()
+        result = json_loads(response.content)
         logger.info(
-            f"Transfer successful - Transaction ID: {result.get('transactionId', 'N/A')}"
+            "Transfer successful - Transaction ID: %s (idempotency key: %s)",
+            result.get('transactionId', 'N/A'), idempotency_key
         )
+        if cache_key is not None:
+            _store_result(cache_key, response.content, config.idempotency_cache_ttl)
         return result
 
     except requests.exceptions.HTTPError as e:
         # Handle HTTP errors (e.g., 400 Bad Request, 500 Server Error)
-        error_detail = e.response.text if e.response else "No response"
-        logger.error(
-            f"HTTP error {e.response.status_code if e.response else 'N/A'}: "
-            f"{error_detail}"
-        )
+        # Note: a Response is falsy for 4xx/5xx, so compare against None explicitly.
+        # Decoding the body (charset detection + decode) only happens if it is logged.
+        if logger.isEnabledFor(logging.ERROR):
+            has_response = e.response is not None
+            logger.error(
+                "HTTP error %s: %s",
+                e.response.status_code if has_response else 'N/A',
+                e.response.text if has_response else "No response"
+            )
         return None
 
-    except requests.exceptions.Timeout as e:
-        # Handle timeout errors
-        logger.error(f"Request timed out after {config.timeout}s: {str(e)}")
+    except requests.exceptions.RequestException as e:
+        # Handle timeouts, connection errors and other request failures. Only the
+        # first two mean the API is unreachable; the rest (e.g. an invalid URL)
+        # are local errors and do not count towards the circuit breaker.
+        if isinstance(e, requests.exceptions.Timeout):
+            _record_outcome(config, False)
+            logger.error("Request timed out after %ss: %s", config.timeout, e)
+        elif isinstance(e, requests.exceptions.ConnectionError):
+            _record_outcome(config, False)
+            logger.error("Connection error - unable to reach API at %s: %s", url, e)
+        else:
+            logger.error("Request failed with exception: %s", e)
         return None
 
-    except requests.exceptions.ConnectionError as e:
-        # Handle connection errors
-        logger.error(f"Connection error - unable to reach API at {url}: {str(e)}")
+    except JSONDecodeError as e:
+        # Handle unparseable responses; anything else is a bug and propagates
+        logger.error("Failed to parse response JSON: %s", e)
         return None
 
-    except requests.exceptions.RequestException as e:
-        # Handle other request-related exceptions
-        logger.error(f"Request failed with exception: {str(e)}")
-        return None
 
-    except ValueError as e:
-        # Handle JSON parsing errors
-        logger.error(f"Failed to parse response JSON: {str(e)}")
-        return None
+async def transfer_money_async(
+    from_acc: str,
+    to_acc: str,
+    amount_minor: int,
+    config: Optional[TransferConfig] = None,
+    jwt_token: Optional[str] = None,
+    session: Optional["requests.Session"] = None,
+    token_provider: Optional[TokenProvider] = None,
+    idempotency_key: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Transfer money without blocking the event loop.
 
-    except Exception as e:
-        # Catch-all for unexpected errors
-        logger.error(f"Unexpected error occurred: {type(e).__name__} - {str(e)}")
-        return None
+    The blocking request runs in a worker thread on the shared pooled session,
+    so many transfers can be awaited concurrently (e.g. with ``asyncio.gather``)
+    and their network round-trips overlap. Concurrency is bounded by the event
+    loop's default executor.
 
+    Args:
+        from_acc (str): Source account identifier.
+        to_acc (str): Destination account identifier.
+        amount_minor (int): Amount to transfer in minor units (cents) of the account's currency.
+        config (Optional[TransferConfig]): Transfer configuration object.
+        jwt_token (Optional[str]): Optional JWT token for authenticated requests.
+        session (Optional[requests.Session]): Session to send the request with.
+            Defaults to the shared session for ``config``.
+        token_provider (Optional[TokenProvider]): Source of JWT tokens, refreshed once on 401.
+        idempotency_key (Optional[str]): Key identifying this logical transfer; generated if omitted.
+
+    Returns:
+        Optional[Dict[str, Any]]: Same result as :func:`transfer_money`.
+
+    Raises:
+        ValueError: If amount is negative or accounts are invalid
+    """
+    if config is None:
+        config = TransferConfig.from_environment()
+
+    # Resolve the shared session on the event loop thread so workers never race to create it
+    if session is None:
+        from client import get_session
+        session = get_session(config)
+
+    return await asyncio.to_thread(
+        transfer_money, from_acc, to_acc, amount_minor, config, jwt_token, session, token_provider,
+        idempotency_key
+    )
+
+
+def _collect_results(
+    transfers: List[Tuple[str, str, int]],
+    outcomes: Iterable[Any]
+) -> List[Optional[Dict[str, Any]]]:
+    """Map per-transfer exceptions to None, matching transfer_money's failure result."""
+    results = []
+    for (from_acc, to_acc, amount_minor), outcome in zip(transfers, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(
+                "Transfer %s -> %s ($%.2f) failed: %s", from_acc, to_acc, amount_minor / 100, outcome
+            )
+            outcome = None
+        results.append(outcome)
+    return results
+
+
+async def transfer_money_many(
+    transfers: Iterable[Tuple[str, str, int]],
+    config: Optional[TransferConfig] = None,
+    jwt_token: Optional[str] = None,
+    token_provider: Optional[TokenProvider] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Run many transfers concurrently.
+
+    All transfers share one pooled session and run on a dedicated pool of
+    ``config.max_concurrency`` worker threads, so that many are in flight at
+    once and N round-trips cost roughly N / max_concurrency round-trip times.
+
+    Args:
+        transfers (Iterable[Tuple[str, str, int]]): (from_acc, to_acc, amount_minor) tuples.
+        config (Optional[TransferConfig]): Transfer configuration object.
+        jwt_token (Optional[str]): Optional JWT token for authenticated requests.
+        token_provider (Optional[TokenProvider]): Source of JWT tokens, refreshed once on 401.
+
+    Returns:
+        List[Optional[Dict[str, Any]]]: Result per transfer in input order, or None
+        where the transfer failed or raised.
+    """
+    if config is None:
+        config = TransferConfig.from_environment()
+
+    from client import get_session
+
+    transfers = list(transfers)
+    session = get_session(config)
+    loop = asyncio.get_running_loop()
+
+    executor = ThreadPoolExecutor(max_workers=config.max_concurrency, thread_name_prefix="transfer")
+    try:
+        outcomes = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, transfer_money,
+                    from_acc, to_acc, amount_minor, config, jwt_token, session, token_provider
+                )
+                for from_acc, to_acc, amount_minor in transfers
+            ),
+            return_exceptions=True
+        )
     finally:
-        # Ensure session is closed
-        if 'session' in locals():
-            session.close()
+        # Never block the event loop here: on cancellation (e.g. Ctrl+C) drop the
+        # queued transfers and let the ones already sending finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return _collect_results(transfers, outcomes)
+
+
+def transfer_money_parallel(
+    transfers: Iterable[Tuple[str, str, int]],
+    config: Optional[TransferConfig] = None,
+    jwt_token: Optional[str] = None,
+    token_provider: Optional[TokenProvider] = None,
+    max_workers: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Run many transfers concurrently from synchronous code, without an event loop.
+
+    Blocking counterpart of :func:`transfer_money_many`. Each transfer runs on a
+    worker thread of a ThreadPoolExecutor; the threads share one pooled session
+    and release the GIL while waiting on the network. Unlike ``asyncio.run`` it
+    also works when called from inside a running event loop.
+
+    Args:
+        transfers (Iterable[Tuple[str, str, int]]): (from_acc, to_acc, amount_minor) tuples.
+        config (Optional[TransferConfig]): Transfer configuration object.
+        jwt_token (Optional[str]): Optional JWT token for authenticated requests.
+        token_provider (Optional[TokenProvider]): Source of JWT tokens, refreshed once on 401.
+        max_workers (Optional[int]): Worker threads (default: ``config.max_concurrency``).
+            Keep it at or below ``config.max_concurrency``, the session's connection
+            pool size, or surplus connections are closed instead of reused.
+
+    Returns:
+        List[Optional[Dict[str, Any]]]: Result per transfer in input order, or None
+        where the transfer failed or raised.
+    """
+    if config is None:
+        config = TransferConfig.from_environment()
+
+    from client import get_session
+
+    transfers = list(transfers)
+    session = get_session(config)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or config.max_concurrency, thread_name_prefix="transfer"
+    ) as executor:
+        futures = [
+            executor.submit(
+                transfer_money, from_acc, to_acc, amount_minor, config, jwt_token, session, token_provider
+            )
+            for from_acc, to_acc, amount_minor in transfers
+        ]
+        outcomes = [future.exception() or future.result() for future in futures]
+
+    return _collect_results(transfers, outcomes)
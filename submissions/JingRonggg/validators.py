@@ -1,20 +1,40 @@
 """Input validation utilities for money transfer operations."""
 
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from numbers import Integral
 
-def validate_transfer_inputs(from_acc: str, to_acc: str, amount: float) -> None:
+_CENT = Decimal("0.01")
+
+
+def validate_transfer_inputs(from_acc: str, to_acc: str, amount_minor: int) -> None:
     """
     Validate transfer input parameters.
 
+    Plain ``int`` amounts take a single-test fast path. Other integral types
+    (e.g. ``numpy.int64``) are accepted on a slower path; floats, Decimals and
+    bools are rejected rather than silently truncated or coerced.
+
     Args:
         from_acc (str): Source account identifier.
         to_acc (str): Destination account identifier.
-        amount (float): Transfer amount.
+        amount_minor (int): Transfer amount in minor units (cents).
 
     Raises:
         ValueError: If any validation fails.
     """
-    if amount <= 0:
-        raise ValueError(f"Amount must be positive, got: {amount}")
+    # Fast path: valid input passes a single short-circuit test. The exact type
+    # check keeps bool (an int subclass) and other numeric types off this path.
+    if amount_minor.__class__ is int and amount_minor > 0 and from_acc and to_acc and from_acc != to_acc:
+        return
+
+    # Cold path: work out which check failed
+    if isinstance(amount_minor, bool) or not isinstance(amount_minor, Integral):
+        raise ValueError(
+            f"Amount must be a whole number of minor units (cents), got: {amount_minor!r}"
+        )
+
+    if amount_minor <= 0:
+        raise ValueError(f"Amount must be positive, got: {amount_minor / 100:.2f}")
     
     if not from_acc or not to_acc:
         raise ValueError("Account identifiers cannot be empty")
@@ -23,20 +43,55 @@ def validate_transfer_inputs(from_acc: str, to_acc: str, amount: float) -> None:
         raise ValueError("Cannot transfer to the same account")
 
 
-def parse_amount(amount_str: str) -> float:
+def is_valid_transfer(from_acc: str, to_acc: str, amount_minor: int) -> bool:
     """
-    Parse and validate amount string.
+    Check transfer inputs with a single combined test.
+
+    Cheaper than :func:`validate_transfer_inputs` for bulk filtering, but does
+    not say which check failed.
 
     Args:
-        amount_str (str): String representation of amount.
+        from_acc (str): Source account identifier.
+        to_acc (str): Destination account identifier.
+        amount_minor (int): Transfer amount in minor units (cents).
 
     Returns:
-        float: Parsed float amount.
+        bool: True if the transfer would pass validation.
+    """
+    if amount_minor.__class__ is int:
+        return amount_minor > 0 and bool(from_acc) and bool(to_acc) and from_acc != to_acc
+
+    # Unusual amount types: defer to the full validation
+    try:
+        validate_transfer_inputs(from_acc, to_acc, amount_minor)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_amount(amount_str: str) -> int:
+    """
+    Parse and validate amount string into integer minor units.
+
+    Only plain decimal notation is accepted (optional sign, digits, at most one
+    decimal point). The amount is rounded half-up to whole cents, so "12.345"
+    becomes 1235.
+
+    Args:
+        amount_str (str): String representation of amount, e.g. "12.34".
+
+    Returns:
+        int: Amount in minor units (cents), e.g. 1234.
 
     Raises:
         ValueError: If amount string is invalid.
     """
+    # Reject obviously malformed input (letters, exponents, NaN/Infinity) without
+    # going through Decimal's exception path
+    if not amount_str.strip().lstrip("+-").replace(".", "", 1).isdigit():
+        raise ValueError(f"Invalid amount: '{amount_str}'. Please enter a valid number.")
+
     try:
-        return float(amount_str)
-    except ValueError:
+        return int(Decimal(amount_str).quantize(_CENT, rounding=ROUND_HALF_UP) * 100)
+    except InvalidOperation:
         raise ValueError(f"Invalid amount: '{amount_str}'. Please enter a valid number.")